@@ -7,6 +7,8 @@
 # - pandas (pip install pandas)
 # - pillow (pip install pillow)
 # - pytesseract (pip install pytesseract)
+# - tesserocr (optional, pip install tesserocr) - faster in-process OCR, used instead of pytesseract when available
+# - orjson (optional, pip install orjson) - faster loading/saving of contacts.csv
 # - pdf2image (pip install pdf2image)
 # - Tesseract OCR (installer available at https://github.com/UB-Mannheim/tesseract/wiki)
 # - Poppler (binary available at https://github.com/oschwartz10612/poppler-windows/releases/)
@@ -20,41 +22,61 @@ import time
 import uuid
 import re
 import difflib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
-from PIL import Image
 
-# External libraries for OCR/PDF
 try:
-    import pytesseract
-    from pdf2image import convert_from_path
+    import orjson   # Optional: much faster (de)serialising of the Image/Notes Data columns
 except ImportError:
-    print("OCR libraries not found. Install pytesseract and pdf2image for full functionality.")
-    pytesseract = None
-    convert_from_path = None
+    orjson = None
+
+# External libraries for OCR/PDF. They load native code, so they're imported on first use by load_ocr_libraries()
+Image = None
+pytesseract = None
+convert_from_path = None
+tesserocr = None    # Runs Tesseract in-process instead of launching tesseract.exe for every card
+ocr_libraries_loaded = False
 
 # PyQt6 Imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTableWidget, QTableWidgetItem, QPushButton, 
+    QTableView, QStyledItemDelegate, QPushButton, 
     QLineEdit, QLabel, QFileDialog, QMenu, QSplitter, 
     QTabWidget, QTextEdit, QFormLayout, QDialog,
     QMessageBox, QInputDialog, QAbstractItemView, QCheckBox, QFrame,
     QHeaderView, QWidgetAction
 )
-from PyQt6.QtGui import QPixmap, QAction, QColor, QDesktopServices, QPalette, QCursor, QFont, QFontMetrics
-from PyQt6.QtCore import Qt, QSize, QUrl, QEvent, QTimer
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QAction, QColor, QDesktopServices, QPalette, QCursor, QFont, QFontMetrics
+from PyQt6.QtCore import Qt, QSize, QUrl, QEvent, QTimer, QAbstractTableModel, QModelIndex, QThread, pyqtSignal
 
 # ==========================================
 # CONFIGURATION & CONSTANTS
 # ==========================================
 
 # WINDOWS USERS: Configure Tesseract/Poppler if needed
-if pytesseract: pytesseract.pytesseract.tesseract_cmd = "C:\\Users\\240039123\\AppData\\Local\\Programs\\Tesseract-OCR\\tesseract.exe"
+DEFAULT_TESSERACT_PATH = "C:\\Users\\240039123\\AppData\\Local\\Programs\\Tesseract-OCR\\tesseract.exe"
 DEFAULT_POPPLER_PATH = "C:\\Users\\240039123\\AppData\\Local\\poppler-25.12.0\\Library\\bin\\"
 
+# OCR runs one Tesseract process per card in parallel, so keep each one single-threaded to avoid oversubscription
+OCR_WORKERS = os.cpu_count() or 1
+OCR_QUEUE_SIZE = 8  # Rendered cards waiting for OCR
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 
 DEFAULT_CSV_NAME = "contacts.csv"
 IMG_FOLDER_NAME = "card_images"
+THUMB_FOLDER_NAME = "thumbs"    # Inside IMG_FOLDER_NAME
+THUMB_SUFFIX = ".jpg"           # Change (e.g. to ".v2.jpg") along with THUMB_SIZE or the encoding, so old thumbnails are rebuilt and swept
+THUMB_SIZE = (320, 200)         # Bounding box for table thumbnails, about 2x the default image column
+THUMB_WORKERS = min(4, OCR_WORKERS)     # Threads loading table thumbnails
+SEARCH_DEBOUNCE_MS = 150        # Default quiet time after the last keystroke before the table is filtered
+SAVE_DEBOUNCE_MS = 500          # Quiet time after the last edit before contacts.csv is written
+SMOOTH_SCALE_DELAY_MS = 120     # Quiet time after an image label stops resizing before it is smooth scaled
+PIXMAP_CACHE_KB = 64 * 1024     # Qt's default is 10 MB, which only holds a few screens of thumbnails
+AUTOSIZE_SAMPLE_ROWS = 200      # Rows measured when auto-fitting a column to its contents
 CONFIG_FILE = "config.txt"
 
 CSV_HEADERS = [
@@ -62,16 +84,35 @@ CSV_HEADERS = [
     "E-mail Address", "Mobile Phone", "Business Phone", 
     "Address", "Notes Data", "Image Data"
 ]
+JSON_COLS = ("Notes Data", "Image Data")    # Stored in the CSV as JSON text
 
 ALL_AVAILABLE_COLS = [
     "First Name", "Last Name", "Company", "Job Title",
     "E-mail Address", "Mobile Phone", "Business Phone", "Address"
 ]
 
+# --- CARD PARSING PATTERNS ---
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(?:(?:\+?1\s*(?:[.-]\s*)?)?(?:\(\s*([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9])\s*\)|([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9]))\s*(?:[.-]\s*)?)?([2-9]1[02-9]|[2-9][02-9]1|[2-9][02-9]{2})\s*(?:[.-]\s*)?([0-9]{4})(?:\s*(?:#|x\.?|ext\.?|extension)\s*(\d+))?')
+URL_RE = re.compile(r'(https?://)?(www\.)?([a-zA-Z0-9-]+)(\.[a-zA-Z]{2,})+')
+ZIP_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+NON_DIGIT_RE = re.compile(r'\D')
+DIGIT_WORD_RE = re.compile(r'\S*\d\S*')                 # Words containing a digit, i.e. phone number candidates
+OCR_DIGIT_FIXES = str.maketrans("OoIl|", "00111")      # Letters Tesseract commonly returns in place of 0 and 1
+OCR_CLEAN_TABLE = str.maketrans({"\x00": None, "\x0c": "\n", "\r": "\n", "\t": " ", "\u00a0": " "})    # Control chars/odd spacing from Tesseract
+SPACE_RUN_RE = re.compile(r' {2,}')
+
+# Columns whose values repeat across many contacts; loaded rows share one string per distinct value
+REPEATED_COLS = ("Company", "Job Title")
+
 DEFAULT_CONFIG = {
     "working_directory": os.getcwd(),
     "poppler_bin": "C:\\Users\\240039123\\AppData\\Local\\poppler-25.12.0\\Library\\bin\\",
     "tesseract_path": "C:\\Users\\240039123\\AppData\\Local\\Programs\\Tesseract-OCR\\tesseract.exe",
+    "pdf_render_dpi": 120,     # PDFs added in the contact editor; OCR imports keep Poppler's 200 DPI for accuracy
+    "import_max_dim": 2048,    # Larger images added in the contact editor are saved downscaled to this size
+    "search_debounce_ms": SEARCH_DEBOUNCE_MS,
+    "search_min_length": 0,    # Shorter searches show every contact, e.g. 2 to skip filtering on the first letter
     "visible_columns": ["First Name", "Last Name", "Company", "E-mail Address", "Mobile Phone"],
     "show_images": True,
     "show_directory_bar": False,
@@ -88,40 +129,279 @@ DEFAULT_CONFIG = {
     }
 }
 
+# --- EDITOR STYLESHEETS (by theme) ---
+EDITOR_QSS = {
+    "Light": """
+        QMenu { background-color: white; border: 1px solid #ccc; color: black; }
+        QMenu::item { background-color: transparent; padding: 4px 20px; color: black; }
+        QMenu::item:selected { background-color: #f3f3f3; color: black; }
+        QTabWidget::pane { border: 1px solid #C2C7CB; }
+        QTabBar::tab { background: #E0E0E0; color: black; padding: 5px; }
+        QTabBar::tab:selected { background: white; font-weight: bold; border-bottom: 2px solid #308cc6; }
+    """,
+    "Dark": """
+        QMenu { background-color: #2d2d2d; border: 1px solid #555; color: white; }
+        QMenu::item { background-color: transparent; padding: 4px 20px; color: white; }
+        QMenu::item:selected { background-color: #2a82da; color: white; }
+        QTabBar::tab { background: #454545; color: white; padding: 5px; }
+        QTabBar::tab:selected { background: #666666; font-weight: bold; border-bottom: 2px solid #2a82da; }
+    """,
+}
+TAB_MENU_QSS = {
+    "Light": """
+        QMenu { background-color: white; border: 1px solid #ccc; color: black; }
+        QMenu::item { background-color: transparent; padding: 5px 20px; }
+        QMenu::item:selected { background-color: #e0e0e0; color: black; }
+    """,
+    "Dark": """
+        QMenu { background-color: #2d2d2d; border: 1px solid #555; color: white; }
+        QMenu::item { background-color: transparent; padding: 5px 20px; }
+        QMenu::item:selected { background-color: #2a82da; color: white; }
+    """,
+}
+
 # ==========================================
 # HELPER CLASSES
 # ==========================================
 
+JSON_DECODER = json.JSONDecoder()   # Shared by every cell; json.loads re-validates its arguments on each call
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)  # json.dumps builds a new encoder per call when given options
+
+def json_loads(text):
+    return orjson.loads(text) if orjson else JSON_DECODER.decode(text)
+
+def json_dumps(obj):
+    # Compact and unescaped either way, so the stdlib fallback writes the same text orjson does
+    return orjson.dumps(obj).decode() if orjson else JSON_ENCODER.encode(obj)
+
+def load_ocr_libraries():
+    """ 
+    Imports Pillow and the OCR/PDF libraries the first time they're needed.
+    Call from the GUI thread before starting anything that uses them.
+    """ 
+    global Image, pytesseract, convert_from_path, tesserocr, ocr_libraries_loaded
+    if ocr_libraries_loaded: return
+
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Pillow not found. Install pillow to import business cards.")
+        return
+    try:
+        import pytesseract as tesseract_module
+        from pdf2image import convert_from_path as convert_module
+        tesseract_module.pytesseract.tesseract_cmd = DEFAULT_TESSERACT_PATH
+        pytesseract, convert_from_path = tesseract_module, convert_module
+    except ImportError:
+        print("OCR libraries not found. Install pytesseract and pdf2image for full functionality.")
+    try:
+        import tesserocr
+    except ImportError:
+        pass
+    ocr_libraries_loaded = True
+
+@contextmanager
+def frozen(widget):
+    """ Holds off repainting `widget` until the block ends, so a batch of changes is drawn once. Safe to nest """
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if was_enabled: widget.setUpdatesEnabled(True)
+
+def thumbnail_path(path):
+    return os.path.join(os.path.dirname(path), THUMB_FOLDER_NAME, os.path.basename(path) + THUMB_SUFFIX)
+
+def sweep_thumbnails(img_dir):
+    """ Deletes thumbnails whose card image is gone or that were made with an older THUMB_SUFFIX """
+    thumb_dir = os.path.join(img_dir, THUMB_FOLDER_NAME)
+    try:
+        sources = set(os.listdir(img_dir))
+        names = os.listdir(thumb_dir)
+    except OSError as e:
+        if not isinstance(e, FileNotFoundError): print(f"Could not clean up thumbnails: {e}")
+        return
+    for name in names:
+        if name.endswith(".tmp"): continue  # Being written by make_thumbnail, which removes it if it fails
+        source = name[:-len(THUMB_SUFFIX)]
+        if name.endswith(THUMB_SUFFIX) and (source in sources or os.path.exists(os.path.join(img_dir, source))):
+            continue    # The second check catches images imported since the folder was listed
+        try:
+            os.remove(os.path.join(thumb_dir, name))
+        except OSError as e:
+            print(f"Could not delete thumbnail {name}: {e}")
+
+thumb_locks = {}    # Thumbnail path -> lock held while it is checked or written
+thumb_locks_guard = threading.Lock()
+
+def make_thumbnail(path):
+    """ 
+    Returns a small JPEG copy of a card image for the table, creating it if missing or out of date.
+    Falls back to the original path if the thumbnail can't be written.
+    Safe to call from several threads at once.
+    """ 
+    if not os.path.exists(path): return path
+    thumb = thumbnail_path(path)
+    with thumb_locks_guard:
+        lock = thumb_locks.setdefault(thumb, threading.Lock())
+    # The table and the import workers can ask for the same thumbnail together; only one of them builds it
+    with lock:
+        tmp = f"{thumb}.{threading.get_ident()}.tmp"
+        try:
+            if os.path.exists(thumb) and os.path.getmtime(thumb) >= os.path.getmtime(path):
+                return thumb
+            os.makedirs(os.path.dirname(thumb), exist_ok=True)
+            from PIL import Image   # Only needed when a thumbnail is missing, so not worth loading at startup
+            with Image.open(path) as img:
+                img.draft("RGB", THUMB_SIZE)    # Lets JPEG decode at reduced scale
+                img = img.convert("RGB")
+                img.thumbnail(THUMB_SIZE)
+                img.save(tmp, "JPEG", quality=85, optimize=True)
+            os.replace(tmp, thumb)  # Readers see the old thumbnail or the new one, never a half-written file
+            return thumb
+        except Exception as e:
+            print(f"Could not create thumbnail for {path}: {e}")
+            try:
+                if os.path.exists(tmp): os.remove(tmp)
+            except OSError: pass
+            return path
+
+def read_image_within(path, bound):
+    """ 
+    Reads an image, decoding it straight down to fit in `bound` if it is larger (never upscaling).
+    Returns a QImage, so it is safe to call off the GUI thread.
+    """ 
+    reader = QImageReader(path)
+    full = reader.size()
+    if full.isValid() and (full.width() > bound.width() or full.height() > bound.height()):
+        reader.setScaledSize(full.scaled(bound, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+def file_pixmap_key(path, bound):
+    return f"file:{path}:{os.path.getmtime(path)}:{bound.width()}x{bound.height()}"
+
+def cached_pixmap(path, bound):
+    """ Pixmap of an image file no larger than `bound`, shared through QPixmapCache until the file changes """
+    key = file_pixmap_key(path, bound)
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = QPixmap.fromImage(read_image_within(path, bound))
+        if not pix.isNull(): QPixmapCache.insert(key, pix)
+    return pix
+
+def import_card_file(src, dst, max_dim=None):
+    """ 
+    Puts an imported image into the card folder. Hard-links when source and folder share a drive,
+    so nothing is copied; falls back to a normal copy otherwise.
+    Images larger than `max_dim` on either side are saved downscaled instead.
+    """ 
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst): return   # Already in the card folder (or linked there); removing dst would delete it
+        # Replace rather than write into it: dst may be a link to a file the user still has elsewhere
+        os.remove(dst)
+        if os.path.exists(thumbnail_path(dst)): os.remove(thumbnail_path(dst))
+    if max_dim:
+        try:
+            if save_downscaled(src, dst, max_dim): return
+        except Exception as e:
+            print(f"Could not downscale {src}, importing it as is: {e}")
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def save_downscaled(src, dst, max_dim):
+    """ Saves a copy of src no larger than max_dim x max_dim. Returns False (writing nothing) if src is already small enough """
+    size = QImageReader(src).size()     # Reads only the header
+    if not size.isValid() or max(size.width(), size.height()) <= max_dim:
+        return False
+    from PIL import Image, ImageOps
+    with Image.open(src) as img:
+        img.draft("RGB", (max_dim, max_dim))   # Lets JPEG decode at reduced scale
+        img = ImageOps.exif_transpose(img)      # Orientation lives in EXIF, which the saved copy won't keep
+        if img.mode not in ("RGB", "L"):
+            keep_alpha = img.mode in ("RGBA", "LA", "P") and not dst.lower().endswith((".jpg", ".jpeg"))
+            img = img.convert("RGBA" if keep_alpha else "RGB")
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+        img.save(dst, quality=88, optimize=True)    # Format follows dst's extension; quality only applies to JPEG
+    return True
+
 class AspectRatioLabel(QLabel):
     """ Custom Label to keep aspect ratio of pixmap when resizing """
-    def __init__(self, parent=None, double_click_callback=None):
+    doubleClicked = pyqtSignal()
+
+    def __init__(self, parent=None):
         super().__init__(parent)
         self.setScaledContents(False)
         self._pixmap = None
+        self._image = None          # RGB32 copy of the source, at most 2x the label size, that smooth passes scale from
+        self._scaled_key = None     # Cache key of the scaled pixmap currently shown
+        self._scaled_size = None    # Label size the shown pixmap was smooth scaled for
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_SCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self.updateScaled)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.double_click_callback = double_click_callback
 
     def setPixmap(self, p):
         self._pixmap = p
+        self._image = None
+        self._scaled_key = None
+        self._scaled_size = None
         super().setPixmap(p)
         self.updateScaled()
 
     def resizeEvent(self, e):
-        self.updateScaled()
+        self.updateScaled(fast=True)
         super().resizeEvent(e)
     
     def mouseDoubleClickEvent(self, e):
-        if self.double_click_callback:
-            self.double_click_callback()
+        self.doubleClicked.emit()
         super().mouseDoubleClickEvent(e)
 
-    def updateScaled(self):
+    def updateScaled(self, fast=False):
         if self._pixmap and not self._pixmap.isNull():
             size = self.size()
             if size.width() > 0 and size.height() > 0:
-                scaled = self._pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                # Splitters and window drags resize a pixel at a time; a 1 px change isn't worth rescaling for
+                last = self._scaled_size
+                if last is not None and abs(size.width() - last.width()) < 2 and abs(size.height() - last.height()) < 2: return
+                # Smooth scaling a full-size scan is slow, so reuse earlier results for the same pixmap and size
+                key = f"label:{self._pixmap.cacheKey()}:{size.width()}x{size.height()}"
+                if key == self._scaled_key: return
+                scaled = QPixmapCache.find(key)
+                if scaled is None and fast:
+                    # Mid-drag, show a cheap scale now and only do the smooth pass once resizing stops
+                    super().setPixmap(self._pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation))
+                    self._scaled_key = None
+                    self._scaled_size = None
+                    self._smooth_timer.start()
+                    return
+                if scaled is None:
+                    scaled = QPixmap.fromImage(self.sourceImage(size).scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                    QPixmapCache.insert(key, scaled)
+                self._scaled_key = key
+                self._scaled_size = size
                 super().setPixmap(scaled)
 
+    def sourceImage(self, size):
+        """ 
+        Returns the image smooth passes scale from.
+        Smooth scaling costs in proportion to the source, so a full-size scan is shrunk once to twice the label size
+        (plenty for a good downscale) and only rebuilt if the label grows past that. Kept as RGB32 so each pass
+        scales the image directly, rather than QPixmap.scaled converting to an image and back every time.
+        """ 
+        full = self._pixmap.size()
+        want = full.scaled(size * 2, Qt.AspectRatioMode.KeepAspectRatio)
+        if want.width() >= full.width(): want = full
+        if self._image is None or self._image.width() < want.width():
+            img = self._pixmap.toImage().convertToFormat(QImage.Format.Format_RGB32)
+            if want != full:
+                img = img.scaled(want, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self._image = img
+        return self._image
+
 class PopupDialog(QDialog):
     """ A Frameless Popup that closes on focus loss """
     def __init__(self, parent):
@@ -145,17 +425,455 @@ class FilterCheckBox(QWidget):
         self.chk.toggled.connect(callback)
         layout.addWidget(self.chk)
 
+class ContactsModel(QAbstractTableModel):
+    """ Table model over the filtered contacts. 0 = Select, 1 = Image, 2+ = Data """
+    checkedChanged = pyqtSignal()
+
+    def __init__(self, parent_app):
+        super().__init__(parent_app)
+        self.parent_app = parent_app
+        self.contacts = []      # Filtered rows. References into parent_app.contacts, not copies
+        self.columns = []       # Visible data column names
+        self.checked = set()    # IDs of the rows with a ticked checkbox
+
+    def set_columns(self, columns):
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.endResetModel()
+
+    def set_contacts(self, contacts):
+        self.beginResetModel()
+        self.contacts = contacts
+        if self.checked:
+            self.checked &= {c["ID"] for c in contacts}    # Keep ticks on rows that are still shown
+        self.endResetModel()
+        self.checkedChanged.emit()
+
+    def contact(self, row):
+        return self.contacts[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.contacts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2 + len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return (["✔", "Image"] + self.columns)[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        contact = self.contacts[index.row()]
+        col = index.column()
+
+        if col == 0:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if contact["ID"] in self.checked else Qt.CheckState.Unchecked
+            return None
+
+        if col == 1:
+            # Path of the first card image, painted by ImageDelegate
+            if role == Qt.ItemDataRole.UserRole:
+                img_data = contact.get("Image Data", [])
+                return img_data[0]["path"] if img_data else None
+            return None
+
+        key = self.columns[col - 2]
+        val = contact.get(key, "")
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(val)
+        if key == "E-mail Address" and val:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.parent_app.theme_colors["link_color"]
+            if role == Qt.ItemDataRole.FontRole:
+                return self.parent_app.link_font
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if index.column() != 0 or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        cid = self.contacts[index.row()]["ID"]
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self.checked.add(cid)
+        else:
+            self.checked.discard(cid)
+        self.dataChanged.emit(index, index, [role])
+        self.checkedChanged.emit()
+        return True
+
+    def is_checked(self, row):
+        return self.contacts[row]["ID"] in self.checked
+
+    def set_all_checked(self, checked):
+        self.checked = {c["ID"] for c in self.contacts} if checked else set()
+        if self.contacts:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.contacts) - 1, 0), [Qt.ItemDataRole.CheckStateRole])
+        self.checkedChanged.emit()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not 2 <= column < self.columnCount(): return
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()    # The view's selection and current cell; they follow their contact
+        old_ids = [self.contacts[i.row()]["ID"] for i in old_indexes]
+        self.sort_rows(self.contacts, column, order)
+        new_rows = {c["ID"]: row for row, c in enumerate(self.contacts)}
+        self.changePersistentIndexList(old_indexes, [self.index(new_rows[cid], i.column()) for cid, i in zip(old_ids, old_indexes)])
+        self.layoutChanged.emit()
+
+    def sort_rows(self, rows, column, order):
+        """ Sorts a list of contacts in place the way `column` sorts the table """
+        if not 2 <= column < self.columnCount(): return
+        key = self.columns[column - 2]
+        rows.sort(key=lambda c: str(c.get(key, "")), reverse=(order == Qt.SortOrder.DescendingOrder))
+
+class ImageDelegate(QStyledItemDelegate):
+    """ 
+    Paints the first card image of a contact into its cell, keeping aspect ratio.
+    Scaled pixmaps live in the global QPixmapCache, so memory stays bounded no matter how many contacts there are.
+    Images not in the cache are loaded on background threads; the cell stays blank until its image arrives.
+    """ 
+    imageReady = pyqtSignal(str, int, str, str, QImage)     # Path, its version, cache key, thumbnail, scaled image (null if unreadable)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = ThreadPoolExecutor(max_workers=THUMB_WORKERS)
+        self.pending = set()    # Cache keys being loaded, so repaints don't queue them again
+        self.imageReady.connect(self.on_image_ready)
+        self.versions = {}      # Card path -> times it was forgotten; part of its cache keys, so bumping it retires them
+        self.missing = set()    # Paths that failed to load, so they aren't retried on every paint
+        self.thumbs = {}        # Card path -> thumbnail to draw, so resizing the column doesn't stat every file again
+
+    def forget(self, paths):
+        """ Drops what is cached for these card images, leaving every other row's pixmaps in place """
+        for path in paths:
+            self.versions[path] = self.versions.get(path, 0) + 1
+            self.missing.discard(path)
+            self.thumbs.pop(path, None)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)   # Background / selection
+        path = index.data(Qt.ItemDataRole.UserRole)
+        if not path or path in self.missing: return
+
+        size = option.rect.size()
+        if size.width() <= 0 or size.height() <= 0: return
+        key = f"card:{self.versions.get(path, 0)}:{size.width()}x{size.height()}:{path}"
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            # Making a missing thumbnail or decoding one would stall scrolling, so it's done in the background
+            if key not in self.pending:
+                self.pending.add(key)
+                self.pool.submit(self.load_image, path, self.versions.get(path, 0), key, size, self.thumbs.get(path))
+            return
+
+        x = option.rect.x() + (option.rect.width() - pix.width()) // 2
+        y = option.rect.y() + (option.rect.height() - pix.height()) // 2
+        painter.drawPixmap(x, y, pix)
+
+    def load_image(self, path, version, key, size, thumb):
+        # Runs on a pool thread. Only a QImage can be made here, and the delegate's state is only touched
+        # on the GUI thread; the signal hands both back there
+        if thumb is None:
+            thumb = make_thumbnail(path)
+        self.imageReady.emit(path, version, key, thumb, read_image_within(thumb, size))
+
+    def on_image_ready(self, path, version, key, thumb, image):
+        self.pending.discard(key)
+        if version != self.versions.get(path, 0): return    # Forgotten while loading; the next paint loads it again
+        self.thumbs[path] = thumb
+        if image.isNull():
+            self.missing.add(path)
+            return
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        self.parent().viewport().update()   # Updates arriving together are painted in one pass
+
+class OcrWorker(QThread):
+    """ 
+    Imports business card files off the GUI thread.
+    One thread renders/copies the files and feeds a bounded queue that a pool of OCR threads drains.
+    """ 
+    resultReady = pyqtSignal(dict)          # Parsed contact data, ready for an editor
+    failed = pyqtSignal(str, str, bool)     # Title, message, is_critical
+    progress = pyqtSignal(int, int)         # Files read, files selected
+
+    def __init__(self, parent_app, files, is_pdf):
+        super().__init__(parent_app)
+        self.parent_app = parent_app
+        self.files = files
+        self.is_pdf = is_pdf
+        self.ocr_errors = []
+        self.done = 0
+        self.done_lock = threading.Lock()   # Shared by the OCR threads
+
+    def run(self):
+        if pytesseract: pytesseract.pytesseract.tesseract_cmd = self.parent_app.config["tesseract_path"]
+
+        # Bounded so rendered pages can't pile up in memory while OCR catches up
+        cards = queue.Queue(maxsize=OCR_QUEUE_SIZE)
+        # Each reader loads its own engine and language data, so don't start more than there are cards
+        n_readers = max(1, min(OCR_WORKERS, len(self.files)))
+        readers = [threading.Thread(target=self.read_cards, args=(cards,), daemon=True) for _ in range(n_readers)]
+        for t in readers: t.start()
+        try:
+            self.render_files(cards)
+        finally:
+            for _ in readers: cards.put(None)
+            for t in readers: t.join()
+
+        if self.ocr_errors:
+            self.failed.emit("OCR Error", f"Failed to parse card text:\n{self.ocr_errors[0]}", False)
+
+    def render_files(self, cards):
+        for f in self.files: # Go thru each file the user selected
+            # Initialize blank data
+            new_data = {k: "" for k in CSV_HEADERS}
+            new_data["ID"] = uuid.uuid4().hex
+            new_data["Image Data"] = []
+            new_data["Notes Data"] = []
+            base_name = "Img"
+            base_name_0 = "Card"
+            base_name_1 = "Back"
+            imgs = []
+            ocr_source = None
+
+            file_base_name = os.path.basename(f)
+            file_name, file_extension = os.path.splitext(file_base_name)
+
+            if self.is_pdf:
+                try:
+                    # POPPLER CHECK: convert_from_path requires Poppler
+                    # You might need to set poppler_path=r'C:\path\to\poppler\bin' if on Windows and not in PATH
+                    poppler_path = self.parent_app.config["poppler_bin"]
+                    # Debug print to console
+                    #print(f"Attempting to convert: {f}")
+                    #print(f"Using Poppler Path: {poppler_path}")
+                    
+                    # Attempt Conversion (Poppler renders the pages in parallel)
+                    imgs = convert_from_path(f, poppler_path=poppler_path, thread_count=OCR_WORKERS)
+                    
+                    if not imgs:
+                        print("PDF converted but returned 0 images.")
+                        
+                    for i, img in enumerate(imgs):
+                        fname = f"{file_name}__{i}.jpg"
+                        path = os.path.join(self.parent_app.config["working_directory"], IMG_FOLDER_NAME, fname)
+                        img.save(path, "JPEG")
+
+                        if i == 0:      # First card / image. Should be front typically
+                            new_data["Image Data"].append({"name": f"{base_name_0}", "path": path})
+                            ocr_source = img    # Only the front of the card is OCR'd
+                            make_thumbnail(path)    # Front is what the table shows
+                        elif i == 1:    # Second card / image. Should be back typically
+                            new_data["Image Data"].append({"name": f"{base_name_1}", "path": path})
+                        else:           # Additional images. No expectation so list as generic import
+                            new_data["Image Data"].append({"name": f"{base_name} {i+1}", "path": path})
+
+                        if i > 0: img.close()   # Saved to disk and not needed for OCR, free the page now
+
+                except Exception as e:
+                    # CRITICAL: Catch the specific error and show it to the user
+                    error_msg = str(e)
+                    print(f"PDF Conversion Error: {error_msg}")
+                    
+                    if "poppler" in error_msg.lower() or "not in path" in error_msg.lower():
+                        self.failed.emit("Poppler Error", 
+                            f"Could not find Poppler tools.\n\n"
+                            f"Current Configured Path: {self.parent_app.config["poppler_bin"]}\n\n"
+                            f"System Error: {error_msg}\n\n"
+                            "Please update the \"poppler_bin\" variable in the \'config.txt\" file.", True)
+                    else:
+                        self.failed.emit("PDF Error", f"Failed to convert PDF:\n{error_msg}", False)
+                    return # Stop processing to avoid opening empty window
+            else:
+                # Standard Image Handling
+                fname = f"{file_name}{file_extension}"
+                path = os.path.join(self.parent_app.config["working_directory"], IMG_FOLDER_NAME, fname)
+                try:
+                    import_card_file(f, path)
+                    new_data["Image Data"].append({"name": base_name_0, "path": path})
+                    ocr_source = path
+                    make_thumbnail(path)
+                except Exception as e:
+                    self.failed.emit("Image Error", f"Failed to process Image:\n{e}", False)
+
+            cards.put((new_data, ocr_source))
+
+    def read_cards(self, cards):
+        # One engine per OCR thread so the language data is loaded once, not once per card
+        api = self.start_tesserocr()
+        try:
+            self.read_cards_with(cards, api)
+        finally:
+            if api: api.End()
+
+    def read_cards_with(self, cards, api):
+        while True:
+            card = cards.get()
+            if card is None: return
+            new_data, ocr_source = card
+
+            # OCR Logic (Requires Tesseract)
+            if ocr_source is not None and (api or pytesseract):
+                try:
+                    text = self.ocr_text(ocr_source, api)
+                    filtered_text = self.parent_app.gibberish_filter(text)
+                    new_data = self.parent_app.heuristic_parse(filtered_text, new_data, self.parent_app.contacts)
+                    new_data["Notes Data"].append({"name": "Card Text", "content": text})
+                except Exception as ocr_e:
+                    print(f"OCR Failed (Tesseract might be missing): {ocr_e}")
+                    self.ocr_errors.append(str(ocr_e))
+
+            # Only open editor if we actually got data/images
+            if new_data["Image Data"]:
+                self.resultReady.emit(new_data)
+            else:
+                print("No data found to populate editor.")
+
+            with self.done_lock:
+                self.done += 1
+                self.progress.emit(self.done, len(self.files))
+
+    def start_tesserocr(self):
+        """ 
+        Returns a tesserocr engine, or None to fall back to pytesseract
+        """ 
+        if not tesserocr: return None
+        # Use the language data that ships next to the configured tesseract.exe if there is one
+        tessdata = os.path.join(os.path.dirname(self.parent_app.config["tesseract_path"]), "tessdata")
+        try:
+            if os.path.isdir(tessdata):
+                return tesserocr.PyTessBaseAPI(path=tessdata, lang="eng")
+            return tesserocr.PyTessBaseAPI(lang="eng")
+        except Exception as e:
+            print(f"tesserocr unavailable, using pytesseract: {e}")
+            return None
+
+    def ocr_text(self, ocr_source, api=None):
+        # Tesseract only uses luminance, so hand it a grayscale copy (a third of the RGB pixel data)
+        img = Image.open(ocr_source) if isinstance(ocr_source, str) else ocr_source
+        try:
+            with img.convert("L") as gray:
+                if api:
+                    api.SetImage(gray)
+                    return api.GetUTF8Text()
+                return pytesseract.image_to_string(gray)
+        finally:
+            img.close()
+
+class ImageImportWorker(QThread):
+    """ Converts/copies the files added to a ContactEditor off the GUI thread """
+    entriesReady = pyqtSignal(list)     # New {"name", "path"} image entries, in file order
+    failed = pyqtSignal(str, str)       # Title, message
+
+    def __init__(self, editor, files, base_name):
+        super().__init__(editor)
+        self.config = editor.parent_app.config
+        self.files = files
+        self.base_name = base_name
+
+    def run(self):
+        base_name = self.base_name
+        new_entries = []
+        stamp = int(time.time())    # One timestamp for the whole batch; file names stay unique via the page count
+        page_count = 0
+        for f in self.files:
+            # --- PDF LOGIC ---
+            if f.lower().endswith(".pdf") and convert_from_path:
+                pil_imgs = []
+                try:
+                    # Get Poppler path from parent app config
+                    poppler_path = self.config.get("poppler_bin", DEFAULT_POPPLER_PATH)
+                    
+                    # Convert PDF (Poppler renders the pages in parallel). These pages are only viewed, so they're
+                    # rendered at a lower DPI than OCR needs; that's still more than the editor pane displays
+                    dpi = self.config.get("pdf_render_dpi", DEFAULT_CONFIG["pdf_render_dpi"])
+                    pil_imgs = convert_from_path(f, poppler_path=poppler_path, dpi=dpi, thread_count=OCR_WORKERS)
+                    
+                    pages = []
+                    for i, img in enumerate(pil_imgs):
+                        # Name format: Name (1), Name (2)...
+                        suffix = f" ({i+1})" if len(pil_imgs) > 1 else ""
+                        tab_name = f"{base_name}{suffix}"
+                        
+                        fname = f"doc_{stamp}_{page_count}.jpg"
+                        page_count += 1
+                        save_path = os.path.join(self.config["working_directory"], IMG_FOLDER_NAME, fname)
+                        pages.append((img, {"name": tab_name, "path": save_path}))
+
+                    # Save files. Pillow releases the GIL while encoding, so pages are compressed in parallel.
+                    # Every page is attempted; the ones that saved are kept as tabs, in page order, even if another failed
+                    with ThreadPoolExecutor(max_workers=OCR_WORKERS) as pool:
+                        saves = [pool.submit(self.save_page, page) for page in pages]
+                        wait(saves)
+                    errors = [save.exception() for save in saves if save.exception()]
+                    new_entries.extend(save.result() for save in saves if not save.exception())
+                    if errors: raise errors[0]
+                
+                except Exception as e:
+                    self.failed.emit("PDF Error", f"Failed to convert PDF.\nCheck Poppler path.\n\nError: {e}")
+                finally:
+                    for img in pil_imgs: img.close()    # Already closed if saved; this catches any that weren't
+
+            # --- IMAGE LOGIC ---
+            else:
+                fname = f"img_{stamp}_{os.path.basename(f)}"
+                save_path = os.path.join(self.config["working_directory"], IMG_FOLDER_NAME, fname)
+                try:
+                    import_card_file(f, save_path, self.config.get("import_max_dim", DEFAULT_CONFIG["import_max_dim"]))
+                    new_entries.append({"name": base_name, "path": save_path})
+                except Exception as e:
+                    print(f"Image Copy Error: {e}")
+
+        # Tabs can be reordered to make any of these the table image, so thumbnail them all while off the GUI thread
+        with ThreadPoolExecutor(max_workers=OCR_WORKERS) as pool:
+            list(pool.map(make_thumbnail, [entry["path"] for entry in new_entries]))
+        self.entriesReady.emit(new_entries)
+
+    def save_page(self, page):
+        img, entry = page
+        try:
+            img.save(entry["path"], "JPEG")
+        finally:
+            img.close()
+        return entry
+
+class ImageDecodeWorker(QThread):
+    """ 
+    Decodes an image file off the GUI thread.
+    Only a QImage can be made outside the GUI thread, so the receiver converts it to a QPixmap.
+    """ 
+    imageReady = pyqtSignal(str, QImage)    # Path, decoded image (null if it couldn't be read)
+
+    def __init__(self, editor, path, bound):
+        super().__init__(editor)
+        self.path = path
+        self.bound = bound
+
+    def run(self):
+        self.imageReady.emit(self.path, read_image_within(self.path, self.bound))
+
 class ContactEditor(QDialog):
     def __init__(self, parent, contact_data=None):
         super().__init__(parent)
         self.parent_app = parent
+        self.decoding = set()   # Image paths being decoded by an ImageDecodeWorker
+        self.tab_menu = None    # Right-click menu of the image/note tabs
         
         if contact_data:
-            self.data = json.loads(json.dumps(contact_data))
+            # Own copy of the contact, including the image/note entry dicts, so edits don't leak back until saved
+            self.data = {k: [dict(e) for e in v] if isinstance(v, list) else v for k, v in contact_data.items()}
         else:
             self.data = {k: "" for k in CSV_HEADERS}
 
-        if "ID" not in self.data or not self.data["ID"]: self.data["ID"] = str(uuid.uuid4())
+        if "ID" not in self.data or not self.data["ID"]: self.data["ID"] = uuid.uuid4().hex
         if not isinstance(self.data.get("Image Data"), list): self.data["Image Data"] = []
         if not isinstance(self.data.get("Notes Data"), list): self.data["Notes Data"] = []
 
@@ -166,23 +884,8 @@ class ContactEditor(QDialog):
         self.apply_local_theme()
 
     def apply_local_theme(self):
-        if self.parent_app.config["theme"] == "Light":
-            self.setStyleSheet("""
-                QMenu { background-color: white; border: 1px solid #ccc; color: black; }
-                QMenu::item { background-color: transparent; padding: 4px 20px; color: black; }
-                QMenu::item:selected { background-color: #f3f3f3; color: black; }
-                QTabWidget::pane { border: 1px solid #C2C7CB; }
-                QTabBar::tab { background: #E0E0E0; color: black; padding: 5px; }
-                QTabBar::tab:selected { background: white; font-weight: bold; border-bottom: 2px solid #308cc6; }
-            """)
-        else:   # theme == Dark
-            self.setStyleSheet("""
-                QMenu { background-color: #2d2d2d; border: 1px solid #555; color: white; }
-                QMenu::item { background-color: transparent; padding: 4px 20px; color: white; }
-                QMenu::item:selected { background-color: #2a82da; color: white; }
-                QTabBar::tab { background: #454545; color: white; padding: 5px; }
-                QTabBar::tab:selected { background: #666666; font-weight: bold; border-bottom: 2px solid #2a82da; }
-            """)
+        self.theme = "Light" if self.parent_app.config["theme"] == "Light" else "Dark"
+        self.setStyleSheet(EDITOR_QSS[self.theme])
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -198,15 +901,16 @@ class ContactEditor(QDialog):
         self.img_tabs.setTabsClosable(False) 
         self.img_tabs.setMovable(True)
         self.img_tabs.tabBarDoubleClicked.connect(self.rename_img_tab)
+        self.img_tabs.currentChanged.connect(self.show_image_tab)
         self.img_tabs.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.img_tabs.customContextMenuRequested.connect(lambda pos: self.show_tab_menu(pos, self.img_tabs, "img"))
         self.img_tabs.setMinimumWidth(50) 
         
         left_layout.addWidget(self.img_tabs)
         
-        btn_add_img = QPushButton("Add Image/PDF")
-        btn_add_img.clicked.connect(self.add_image)
-        left_layout.addWidget(btn_add_img)
+        self.btn_add_img = QPushButton("Add Image/PDF")
+        self.btn_add_img.clicked.connect(self.add_image)
+        left_layout.addWidget(self.btn_add_img)
         
         splitter.addWidget(left_widget)
 
@@ -270,21 +974,21 @@ class ContactEditor(QDialog):
 
         # --- BOTTOM BUTTONS ---
         btn_box = QHBoxLayout()
-        btn_delete = QPushButton("Delete Contact")
-        btn_delete.setStyleSheet("background-color: #d32f2f; color: white; font-weight: bold;")
-        btn_delete.clicked.connect(self.delete_contact)
+        self.btn_delete = QPushButton("Delete Contact")
+        self.btn_delete.setStyleSheet("background-color: #d32f2f; color: white; font-weight: bold;")
+        self.btn_delete.clicked.connect(self.delete_contact)
         
-        btn_save = QPushButton("Save")
-        btn_save.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
-        btn_save.clicked.connect(self.save_contact)
+        self.btn_save = QPushButton("Save")
+        self.btn_save.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.btn_save.clicked.connect(self.save_contact)
         
         self.btn_cancel = QPushButton("Cancel")
         self.btn_cancel.clicked.connect(self.reject)
 
-        if any(c["ID"] == self.data["ID"] for c in self.parent_app.contacts):
-            btn_box.addWidget(btn_delete)
+        if self.data["ID"] in self.parent_app.id_index:
+            btn_box.addWidget(self.btn_delete)
         btn_box.addStretch()
-        btn_box.addWidget(btn_save)
+        btn_box.addWidget(self.btn_save)
         btn_box.addWidget(self.btn_cancel)
         
         layout.addLayout(btn_box)
@@ -294,12 +998,17 @@ class ContactEditor(QDialog):
 
         # Default focus
         #self.btn_cancel.setFocus()
-        btn_save.setFocus()
-        btn_save.setDefault(True)
+        self.btn_save.setFocus()
+        self.btn_save.setDefault(True)
         
 
     def load_images(self):
+        # Rebuild all tabs with one repaint and no per-tab currentChanged
+        self.img_tabs.setUpdatesEnabled(False)
+        self.img_tabs.blockSignals(True)
+        old_pages = [self.img_tabs.widget(i) for i in range(self.img_tabs.count())]
         self.img_tabs.clear()
+        for page in old_pages: page.deleteLater()   # clear() only detaches them, which would keep their pixmaps alive
         images = self.data.get("Image Data", [])
         if not images:
             lbl = QLabel("No Images")
@@ -307,20 +1016,67 @@ class ContactEditor(QDialog):
             self.img_tabs.addTab(lbl, "None")
         
         for img in images:
-            path = img.get("path", "")
-            name = img.get("name", "Img")
-            lbl = AspectRatioLabel()
-            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl.setProperty("file_path", path)
-            if os.path.exists(path):
-                lbl.setPixmap(QPixmap(path))
-            else:
-                lbl.setText("Image Missing")
-            self.img_tabs.addTab(lbl, name)
+            self.add_image_tab(img)
+        self.img_tabs.blockSignals(False)
+        self.show_image_tab(self.img_tabs.currentIndex())
+        self.img_tabs.setUpdatesEnabled(True)
+
+    def add_image_tab(self, img):
+        path = img.get("path", "")
+        lbl = AspectRatioLabel()
+        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lbl.setProperty("file_path", path)
+        if not os.path.exists(path):
+            lbl.setText("Image Missing")
+        self.img_tabs.addTab(lbl, img.get("name", "Img"))    # Decoded by show_image_tab once the tab is opened
+
+    def show_image_tab(self, index):
+        lbl = self.img_tabs.widget(index)
+        if isinstance(lbl, AspectRatioLabel) and lbl.pixmap().isNull():
+            path = lbl.property("file_path")
+            if path in self.decoding or not os.path.exists(path): return
+            if not self.isVisible():
+                # Still being built: the first image sizes the splitter when the editor is shown, so load it now
+                lbl.setPixmap(cached_pixmap(path, self.image_bound()))
+                return
+            pix = QPixmapCache.find(file_pixmap_key(path, self.image_bound()))
+            if pix is not None:
+                lbl.setPixmap(pix)
+                return
+
+            # Decoding a full-size scan takes a moment, so do it in the background rather than freeze the editor
+            lbl.setText("Loading...")
+            self.decoding.add(path)
+            worker = ImageDecodeWorker(self, path, self.image_bound())
+            worker.imageReady.connect(self.on_image_decoded)
+            self.parent_app.ocr_workers.append(worker)     # So closing the app waits for it
+            worker.finished.connect(lambda: self.parent_app.ocr_workers.remove(worker) if worker in self.parent_app.ocr_workers else None)
+            worker.start()
+
+    def image_bound(self):
+        # A tab can never be bigger than the screen, so phone photos and 600 dpi scans aren't decoded past that
+        screen = self.screen()
+        return screen.size() * screen.devicePixelRatio()
+
+    def on_image_decoded(self, path, image):
+        self.decoding.discard(path)
+        pix = QPixmap.fromImage(image)
+        if not pix.isNull() and os.path.exists(path): QPixmapCache.insert(file_pixmap_key(path, self.image_bound()), pix)
+        # Tabs may have been rebuilt meanwhile, so find the labels by path rather than keeping one
+        for i in range(self.img_tabs.count()):
+            lbl = self.img_tabs.widget(i)
+            if isinstance(lbl, AspectRatioLabel) and lbl.property("file_path") == path and lbl.pixmap().isNull():
+                if pix.isNull():
+                    lbl.setText("Image could not be loaded")
+                else:
+                    lbl.setPixmap(pix)
 
     def load_notes(self):
+        self.note_tabs.setUpdatesEnabled(False)
         self.note_tabs.blockSignals(True)
+        old_pages = [self.note_tabs.widget(i) for i in range(self.note_tabs.count())]
         self.note_tabs.clear()
+        for page in old_pages: page.deleteLater()
         notes = self.data.get("Notes Data", [])
         if not notes: 
             notes = [{"name": "General", "content": ""}]
@@ -332,6 +1088,7 @@ class ContactEditor(QDialog):
             self.note_tabs.addTab(txt, note.get("name", "Note"))
         
         self.note_tabs.blockSignals(False)
+        self.note_tabs.setUpdatesEnabled(True)
 
     def add_image(self):
         # Can add images or PDFs
@@ -341,42 +1098,25 @@ class ContactEditor(QDialog):
         base_name, ok = QInputDialog.getText(self, "Tab Name", "Enter new image tab name:", text="Doc")
         if not ok: base_name = "Doc"
 
-        new_entries = []
-        for f in files:
-            # --- PDF LOGIC ---
-            if f.lower().endswith(".pdf") and convert_from_path:
-                try:
-                    # Get Poppler path from parent app config
-                    poppler_path = self.parent_app.config.get("poppler_bin", DEFAULT_POPPLER_PATH)
-                    
-                    # Convert PDF
-                    pil_imgs = convert_from_path(f, poppler_path=poppler_path)
-                    
-                    for i, img in enumerate(pil_imgs):
-                        # Name format: Name (1), Name (2)...
-                        suffix = f" ({i+1})" if len(pil_imgs) > 1 else ""
-                        tab_name = f"{base_name}{suffix}"
-                        
-                        # Save file
-                        fname = f"doc_{int(time.time())}_{i}.jpg"
-                        save_path = os.path.join(self.parent_app.config["working_directory"], IMG_FOLDER_NAME, fname)
-                        img.save(save_path, "JPEG")
-                        
-                        new_entries.append({"name": tab_name, "path": save_path})
-                
-                except Exception as e:
-                    QMessageBox.warning(self, "PDF Error", f"Failed to convert PDF.\nCheck Poppler path.\n\nError: {e}")
-
-            # --- IMAGE LOGIC ---
-            else:
-                fname = f"img_{int(time.time())}_{os.path.basename(f)}"
-                save_path = os.path.join(self.parent_app.config["working_directory"], IMG_FOLDER_NAME, fname)
-                try:
-                    shutil.copy2(f, save_path)
-                    new_entries.append({"name": base_name, "path": save_path})
-                except Exception as e:
-                    print(f"Image Copy Error: {e}")
-
+        # Converting PDFs can take a while, so it runs in the background; the tabs appear once it's done
+        load_ocr_libraries()
+        self.set_importing(True)
+        worker = ImageImportWorker(self, files, base_name)
+        worker.entriesReady.connect(lambda entries: self.add_image_entries(files, base_name, entries))
+        worker.failed.connect(lambda title, message: QMessageBox.warning(self, title, message))
+        worker.finished.connect(lambda: self.set_importing(False))
+        self.parent_app.ocr_workers.append(worker)     # So closing the app waits for the files to be written
+        worker.finished.connect(lambda: self.parent_app.ocr_workers.remove(worker) if worker in self.parent_app.ocr_workers else None)
+        worker.start()
+
+    def set_importing(self, importing):
+        # Saving or deleting mid-import would hand self.data to the app, which the finished import would then
+        # change in place behind its back
+        for btn in (self.btn_add_img, self.btn_save, self.btn_delete):
+            btn.setEnabled(not importing)
+
+    def add_image_entries(self, files, base_name, new_entries):
+        if not self.isVisible(): return     # Cancelled while importing; self.data is no longer in use
         # Update Data & UI
         if new_entries:
             # Handle multiple file numbering if needed (e.g. Doc (1), Doc (2) for multiple separate files)
@@ -385,15 +1125,21 @@ class ContactEditor(QDialog):
                      entry["name"] = f"{base_name} ({i+1})"
 
             self.data["Image Data"].extend(new_entries)
-            self.load_images()
+            # Only add the new tabs; rebuilding them all would decode the open image again and undo any tab reordering
+            placeholder = self.img_tabs.widget(0)
+            if placeholder is not None and not isinstance(placeholder, AspectRatioLabel):     # "No Images"
+                self.img_tabs.removeTab(0)
+                placeholder.deleteLater()
+            for img in new_entries:
+                self.add_image_tab(img)
             self.img_tabs.setCurrentIndex(self.img_tabs.count()-1)
 
     def add_new_note_tab(self, index):
         self.save_current_notes_to_data()
         new_name = datetime.now().strftime("%m/%d/%Y")
         self.data["Notes Data"].append({"name": new_name, "content": ""})
-        self.load_notes()
-        self.note_tabs.setCurrentIndex(len(self.data["Notes Data"]) - 1)
+        self.note_tabs.addTab(QTextEdit(), new_name)
+        self.note_tabs.setCurrentIndex(self.note_tabs.count() - 1)
 
     def save_current_notes_to_data(self):
         notes = []
@@ -423,44 +1169,45 @@ class ContactEditor(QDialog):
         index = tab_widget.tabBar().tabAt(pos)
         if index == -1: return
 
-        menu = QMenu(self)
-        action_rename = menu.addAction("Rename")
-        action_delete = menu.addAction("Delete")
-
-        if self.parent_app.config["theme"] == "Light":
-            menu.setStyleSheet("""
-                QMenu { background-color: white; border: 1px solid #ccc; color: black; }
-                QMenu::item { background-color: transparent; padding: 5px 20px; }
-                QMenu::item:selected { background-color: #e0e0e0; color: black; }
-            """)
-        else:   # Dark mode style
-            menu.setStyleSheet("""
-                QMenu { background-color: #2d2d2d; border: 1px solid #555; color: white; }
-                QMenu::item { background-color: transparent; padding: 5px 20px; }
-                QMenu::item:selected { background-color: #2a82da; color: white; }
-            """)
+        # Built on first use and kept, so its stylesheet is parsed once per editor rather than per right-click
+        if self.tab_menu is None:
+            self.tab_menu = QMenu(self)
+            self.action_rename = self.tab_menu.addAction("Rename")
+            self.action_delete = self.tab_menu.addAction("Delete")
+            self.tab_menu.setStyleSheet(TAB_MENU_QSS[self.theme])
 
-        action = menu.exec(tab_widget.mapToGlobal(pos))
+        action = self.tab_menu.exec(tab_widget.mapToGlobal(pos))
         
-        if action == action_rename:
+        if action == self.action_rename:
             if type_ == "img": self.rename_img_tab(index)
             else: self.rename_note_tab(index)
-        elif action == action_delete:
+        elif action == self.action_delete:
             if type_ == "img": self.delete_img_tab(index)
             else: 
-                self.save_current_notes_to_data()
+                self.save_current_notes_to_data()     # Notes data now follows the tab order
                 del self.data["Notes Data"][index]
-                self.load_notes()
+                page = self.note_tabs.widget(index)
+                self.note_tabs.removeTab(index)
+                page.deleteLater()
+                if not self.data["Notes Data"]: self.load_notes()     # Puts back an empty "General" note
 
     def delete_img_tab(self, index):
-        if index < len(self.data["Image Data"]):
-            path = self.data["Image Data"][index]["path"]
+        lbl = self.img_tabs.widget(index)
+        if isinstance(lbl, AspectRatioLabel):
+            path = lbl.property("file_path")
             
             # Also delete image from source in file system
             self.parent_app.delete_image_file(path)
 
-            del self.data["Image Data"][index]
-            self.load_images()
+            # Tabs can be dragged out of data order, so go by the tab's file rather than its index.
+            # Any other tab showing the same file goes too, since the file is gone
+            self.data["Image Data"] = [img for img in self.data["Image Data"] if img.get("path") != path]
+            for i in reversed(range(self.img_tabs.count())):
+                page = self.img_tabs.widget(i)
+                if page.property("file_path") == path:
+                    self.img_tabs.removeTab(i)
+                    page.deleteLater()
+            if self.img_tabs.count() == 0: self.load_images()     # Puts back the "No Images" placeholder
 
     def delete_contact(self):
         if QMessageBox.question(self, 'Confirm Delete', "Are you sure you want to delete this contact?",
@@ -498,6 +1245,8 @@ class ContactEditor(QDialog):
 
 
 class RolodexApp(QMainWindow):
+    saveFailed = pyqtSignal(str)    # Error from the background contacts.csv write
+
     def __init__(self):
         self.current_sort_col = 2   # 2 = first data column, i.e. first name by default
         self.current_sort_order = Qt.SortOrder.AscendingOrder
@@ -510,16 +1259,39 @@ class RolodexApp(QMainWindow):
         self.std_font = QFont("Segoe UI", 10)
         if self.std_font.pointSize() <= 0:
             self.std_font.setPointSize(10)
+        # Underlined copy for e-mail cells, built once rather than on every paint
+        self.link_font = QFont(self.std_font)
+        self.link_font.setUnderline(True)
+
+        # Pixmaps are 4 bytes per device pixel, so HiDPI screens need the cache scaled to hold the same number of images
+        dpr = QApplication.primaryScreen().devicePixelRatio()
+        QPixmapCache.setCacheLimit(int(PIXMAP_CACHE_KB * dpr * dpr))
 
         # Initialize list for keeping track of multiple editor windows
         self.open_editors = [] 
+        self.ocr_workers = []   # Background card imports in progress
 
         # Load Config
         self.config = DEFAULT_CONFIG.copy()
+        self.config_text = None     # config.txt contents as last read/written, to skip saves that change nothing
         self.load_config()
         
         self.contacts = []
+        self.id_index = {}          # ID -> position in self.contacts
+        self.search_texts = []      # Casefolded text the search bar matches against, parallel to self.contacts
+        self.search_hits = None     # (query, positions in self.contacts it matched); reset whenever contacts change
         self.active_filters = {} 
+        self.filter_values = {}     # Column -> distinct values among the shown rows, for the filter menus
+
+        # contacts.csv is written in the background, once a burst of edits settles
+        self.save_pending = False
+        self.save_thread = None
+        self.save_error = None      # Set by a failed background write until the GUI thread has dealt with it
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self.save_timer.timeout.connect(self.flush_contacts)
+        self.saveFailed.connect(self.on_save_failed)
 
         self.ensure_directories()
         self.apply_theme()
@@ -529,10 +1301,15 @@ class RolodexApp(QMainWindow):
         self.refresh_table()
         
         # IMPROVEMENT 3: Auto-fit columns at startup
-        for i in range(2, self.table.columnCount()):
-            self.autosize_column(i)
-        self.table.setColumnWidth(0, 50) 
-        self.table.setColumnWidth(1, 100)
+        with frozen(self.table):
+            for i in range(2, self.model.columnCount()):
+                self.autosize_column(i)
+            self.table.setColumnWidth(0, 50) 
+            self.table.setColumnWidth(1, 100)
+
+        # Thumbnails of deleted or replaced images would otherwise pile up
+        img_dir = os.path.join(self.config["working_directory"], IMG_FOLDER_NAME)
+        threading.Thread(target=sweep_thumbnails, args=(img_dir,), daemon=True).start()
 
     # ==========================
     # DATA HANDLING (CRITICAL)
@@ -540,54 +1317,143 @@ class RolodexApp(QMainWindow):
     def load_data(self):
         path = os.path.join(self.config["working_directory"], DEFAULT_CSV_NAME)
         self.contacts = []
+        self.id_index = {}
+        self.search_texts = []
+        self.search_hits = None
         if os.path.exists(path):
-            with open(path, mode='r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try: row["Image Data"] = json.loads(row.get("Image Data", "[]"))
-                    except: row["Image Data"] = []
-                    try: row["Notes Data"] = json.loads(row.get("Notes Data", "[]"))
-                    except: row["Notes Data"] = []
+            # newline='' lets the csv module handle line breaks inside quoted fields (multi-line addresses/notes)
+            with open(path, mode='r', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                # Every row shares these key objects. Known columns reuse the CSV_HEADERS strings, which the code's own
+                # lookups use too, so those lookups match by identity instead of comparing text
+                known = {h: h for h in CSV_HEADERS}
+                headers = [known.get(h) or sys.intern(h) for h in next(reader, [])]
+                for values in reader:
+                    if not values: continue     # Blank line
+                    if len(values) < len(headers): values += [""] * (len(headers) - len(values))   # Short row
+                    # zip drops cells past the header, which DictReader would have stored under a None key
+                    row = dict(zip(headers, values))
+                    for key in JSON_COLS:
+                        raw = row.get(key)
+                        if not raw or raw in ("[]", "null"):    # Most rows; skip the JSON parser (and the exception on blanks)
+                            row[key] = []
+                            continue
+                        try: row[key] = json_loads(raw)
+                        except: row[key] = []
+                        if not isinstance(row[key], list): row[key] = []    # e.g. a cell edited by hand
+                    if not row.get("ID"): row["ID"] = uuid.uuid4().hex    # e.g. rows added outside the app
+                    for key in REPEATED_COLS:
+                        if row.get(key): row[key] = sys.intern(row[key])
+                    self.id_index.setdefault(row["ID"], len(self.contacts))
                     self.contacts.append(row)
+                    self.search_texts.append(self.search_text(row))
+
+    def contact_by_id(self, cid):
+        i = self.id_index.get(cid)
+        return None if i is None else self.contacts[i]
+
+    def rebuild_id_index(self):
+        # Needed after removals, since every later contact moves up
+        self.id_index = {}
+        for i, c in enumerate(self.contacts):
+            self.id_index.setdefault(c["ID"], i)
+
+    def search_text(self, contact):
+        # Built once per load/save so searching doesn't re-join every field on each keystroke.
+        # Only what the user can read: the text columns and notes, not IDs, image paths or JSON
+        parts = [str(contact.get(k, "")) for k in ALL_AVAILABLE_COLS]
+        for note in contact.get("Notes Data", []):
+            if not isinstance(note, dict): continue
+            parts.append(str(note.get("name", "")))
+            parts.append(str(note.get("content", "")))
+        return " ".join(parts).casefold()   # casefold, not lower, so e.g. "Straße" matches "strasse"
     
     def save_data_to_disk(self):
+        # Edits often come in bursts (batch deletes, several editors saved in a row), so write once they settle
+        self.save_pending = True
+        self.save_timer.start()
+
+    def flush_contacts(self):
+        """ 
+        Starts writing contacts.csv if a save is pending.
+        The rows are snapshotted here on the GUI thread; serialising and writing happen on a background thread.
+        """ 
+        if not self.save_pending: return
+        self.save_pending = False
+        self.save_timer.stop()
+
         path = os.path.join(self.config["working_directory"], DEFAULT_CSV_NAME)
-        export_list = []
-        for c in self.contacts:
-            copy_c = c.copy()
-            copy_c["Image Data"] = json.dumps(c.get("Image Data", []))
-            copy_c["Notes Data"] = json.dumps(c.get("Notes Data", []))
-            export_list.append(copy_c)
-            
-        with open(path, mode='w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            writer.writerows(export_list)
+        # Contacts are only ever replaced, never edited in place (editors work on copies), so copying the list is enough
+        rows = list(self.contacts)
+        if self.save_thread: self.save_thread.join()    # Keep writes in order
+        self.save_thread = threading.Thread(target=self.write_contacts, args=(path, rows))
+        self.save_thread.start()
+
+    def write_contacts(self, path, rows):
+        # Write a temp file and swap it in, so a crash or full disk can't leave a half-written contacts.csv
+        tmp = path + ".tmp"
+        try:
+            # One large buffer so the whole file goes out in a few writes instead of one per 8 KB
+            with open(tmp, mode='w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+                # Plain rows built straight from the contacts; columns not in CSV_HEADERS are dropped
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADERS)
+                writer.writerows([json_dumps(c.get(h, [])) if h in JSON_COLS else c.get(h, "") for h in CSV_HEADERS] for c in rows)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            self.save_error = None  # This write had every edit, so an earlier failure is made good
+        except Exception as e:
+            print(f"Save Error: {e}")
+            try:
+                if os.path.exists(tmp): os.remove(tmp)
+            except OSError: pass
+            self.save_error = str(e)    # Set before the thread ends, so closeEvent sees it straight after join()
+            self.saveFailed.emit(str(e))
+
+    def on_save_failed(self, error):
+        if self.save_error is None: return  # Already handled by closeEvent, or a later write succeeded
+        self.save_error = None
+        # The edits are still in memory; keep them pending so the next flush (or closing the app) writes them again
+        self.save_pending = True
+        QMessageBox.warning(self, "Save Error", f"Could not save contacts:\n{error}")
 
     def save_contact_data(self, contact_data):
         cid = contact_data["ID"]
-        existing = next((i for i, c in enumerate(self.contacts) if c["ID"] == cid), None)
+        existing = self.id_index.get(cid)
         if existing is not None:
+            if self.contacts[existing] == contact_data: return     # Saved without edits; the file is already up to date
             self.contacts[existing] = contact_data
+            self.search_texts[existing] = self.search_text(contact_data)
+            self.search_hits = None
         else:
+            self.id_index[cid] = len(self.contacts)
             self.contacts.append(contact_data)
+            self.search_texts.append(self.search_text(contact_data))
+            self.search_hits = None
+        # Its card images may have been replaced under the same file name
+        self.image_delegate.forget(img.get("path") for img in contact_data.get("Image Data", []))
         self.save_data_to_disk()
         self.refresh_table()
 
     def delete_contact_by_id(self, cid):
-        contact = next((c for c in self.contacts if c["ID"] == cid), None)  # Find the contact object first
+        contact = self.contact_by_id(cid)  # Find the contact object first
         if contact:
             # 1. Delete associated images
             for img in contact.get("Image Data", []):
                 self.delete_image_file(img.get("path"))
             # 2. Remove from list
-            self.contacts.remove(contact)
+            i = self.id_index[cid]
+            del self.contacts[i]
+            del self.search_texts[i]
+            self.search_hits = None
+            self.rebuild_id_index()
             # 3. Save and Refresh
             self.save_data_to_disk()
             self.refresh_table()
 
     def delete_selected(self):
-        ids = self.get_selected_ids()
+        ids = set(self.get_selected_ids())
         if not ids: return
 
         reply = QMessageBox.question(self, 'Delete', f"Delete {len(ids)} contacts?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -600,8 +1466,12 @@ class RolodexApp(QMainWindow):
                 # Delete images for this contact, removing from source in file system
                 for img in contact.get("Image Data", []):
                     self.delete_image_file(img.get("path"))
-                # Remove from main list
-                self.contacts.remove(contact)
+            # Remove from main list (and the matching search texts) in one pass
+            keep = [i for i, c in enumerate(self.contacts) if c["ID"] not in ids]
+            self.contacts[:] = [self.contacts[i] for i in keep]
+            self.search_texts = [self.search_texts[i] for i in keep]
+            self.search_hits = None
+            self.rebuild_id_index()
             # Save / Refresh
             self.save_data_to_disk()
             self.refresh_table()
@@ -609,7 +1479,7 @@ class RolodexApp(QMainWindow):
     def edit_selected(self):
         ids = self.get_selected_ids()
         for cid in ids:
-            contact = next((c for c in self.contacts if c["ID"] == cid), None)
+            contact = self.contact_by_id(cid)
             if contact:
                 self.open_editor_data(contact)
 
@@ -617,15 +1487,41 @@ class RolodexApp(QMainWindow):
         if os.path.exists(CONFIG_FILE):
             try:
                 with open(CONFIG_FILE, 'r') as f:
-                    saved = json.load(f)
-                    self.config.update(saved)
+                    text = f.read()
+                self.config.update(json.loads(text))
+                self.config_text = text
             except: pass
 
     def save_config(self):
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        text = json.dumps(self.config, indent=4)
+        if text == self.config_text: return
+        # Write a temp file and swap it in, so a crash mid-write can't leave a truncated config.txt
+        tmp = CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp, 'w') as f:
+                f.write(text)
+            os.replace(tmp, CONFIG_FILE)
+            self.config_text = text
+        except Exception as e:
+            print(f"Could not save config: {e}")
 
     def closeEvent(self, event):
+        for worker in self.ocr_workers:
+            worker.wait()   # Let in-flight imports finish writing their images
+        self.flush_contacts()
+        if self.save_thread: self.save_thread.join()
+        # saveFailed is queued and wouldn't arrive before the window closes, so check the write's result directly
+        error = self.save_error
+        if error is not None:
+            self.save_error = None
+            self.save_pending = True
+        if self.save_pending:
+            reply = QMessageBox.question(self, "Unsaved Changes", f"Could not save contacts:\n{error}\n\nClose anyway and lose the latest changes?",
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        self.image_delegate.pool.shutdown(cancel_futures=True)     # Thumbnails for rows no one will see now
         self.save_config()
         super().closeEvent(event)
 
@@ -637,16 +1533,19 @@ class RolodexApp(QMainWindow):
         is_dark = self.config["theme"] == "Dark"
         palette = QPalette()
         c = self.config["colors_dark"] if is_dark else self.config["colors_light"]
-        
-        palette.setColor(QPalette.ColorRole.Window, QColor(c["window"]))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(c["window_text"]))
-        palette.setColor(QPalette.ColorRole.Base, QColor(c["base"]))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(c["window"]))
-        palette.setColor(QPalette.ColorRole.Text, QColor(c["text"]))
-        palette.setColor(QPalette.ColorRole.Button, QColor(c["button"]))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(c["button_text"]))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(c["highlight"]))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(c["highlight_text"]))
+        # Parsed once per theme change; the table model hands these out on every paint
+        self.theme_colors = {k: QColor(v) for k, v in c.items()}
+        colors = self.theme_colors
+        
+        palette.setColor(QPalette.ColorRole.Window, colors["window"])
+        palette.setColor(QPalette.ColorRole.WindowText, colors["window_text"])
+        palette.setColor(QPalette.ColorRole.Base, colors["base"])
+        palette.setColor(QPalette.ColorRole.AlternateBase, colors["window"])
+        palette.setColor(QPalette.ColorRole.Text, colors["text"])
+        palette.setColor(QPalette.ColorRole.Button, colors["button"])
+        palette.setColor(QPalette.ColorRole.ButtonText, colors["button_text"])
+        palette.setColor(QPalette.ColorRole.Highlight, colors["highlight"])
+        palette.setColor(QPalette.ColorRole.HighlightedText, colors["highlight_text"])
         
         QApplication.instance().setPalette(palette)
         
@@ -715,7 +1614,12 @@ class RolodexApp(QMainWindow):
         toolbar.addWidget(QLabel("Search:"))
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Filter contacts...")
-        self.search_bar.textChanged.connect(self.refresh_table)
+        # Wait for a pause in typing so a burst of keystrokes filters the table once
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.config["search_debounce_ms"])
+        self.search_timer.timeout.connect(self.refresh_table)
+        self.search_bar.textChanged.connect(self.search_timer.start)
         
         c = self.config["colors_dark"] if self.config["theme"] == "Dark" else self.config["colors_light"]
         self.search_bar.setStyleSheet(f"background: {c['input_bg']}; color: {c['text']}; border: 1px solid #888;")
@@ -761,16 +1665,22 @@ class RolodexApp(QMainWindow):
         main_layout.addLayout(toolbar)
 
         # --- TABLE ---
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.model = ContactsModel(self)
+        self.table.setModel(self.model)
+        self.image_delegate = ImageDelegate(self.table)
+        self.table.setItemDelegateForColumn(1, self.image_delegate)
         self.table.setFont(self.std_font)                       # Force font
         self.table.horizontalHeader().setFont(self.std_font)    # Force font
         self.table.verticalHeader().setFont(self.std_font)      # Force font
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)   # Rows are never measured
         self.table.setSortingEnabled(False) 
         self.table.horizontalHeader().setSectionsMovable(True)
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.horizontalHeader().setResizeContentsPrecision(AUTOSIZE_SAMPLE_ROWS)  # Auto-fit measures a sample, not every row
         self.table.horizontalHeader().setSortIndicatorShown(True)
         self.table.horizontalHeader().setSortIndicator(self.current_sort_col, self.current_sort_order)
         
@@ -778,8 +1688,8 @@ class RolodexApp(QMainWindow):
         self.table.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
         self.table.horizontalHeader().sectionResized.connect(self.on_column_resized)
         
-        self.table.itemDoubleClicked.connect(self.on_double_click)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.doubleClicked.connect(self.on_double_click)
+        self.model.checkedChanged.connect(self.update_batch_buttons)
         main_layout.addWidget(self.table)
         
         self.apply_theme()
@@ -864,8 +1774,9 @@ class RolodexApp(QMainWindow):
 
     def toggle_images(self, checked):
         self.config["show_images"] = checked
-        self.table.setColumnHidden(1, not checked)
-        self.adjust_row_heights()
+        with frozen(self.table):
+            self.table.setColumnHidden(1, not checked)
+            self.adjust_row_heights()
         self.save_config()
 
     def toggle_directory_bar(self, checked):
@@ -885,12 +1796,14 @@ class RolodexApp(QMainWindow):
         else:
             if col_name in self.config["visible_columns"]:
                 self.config["visible_columns"].remove(col_name)
-        self.refresh_table_structure()
+        with frozen(self.table):
+            self.refresh_table_structure()
         self.save_config()
 
     def browse_directory(self, popup):
         d = QFileDialog.getExistingDirectory(self, "Select Directory")
         if d:
+            self.flush_contacts()   # Pending edits belong to the current directory
             self.config["working_directory"] = d
             self.dir_edit_popup.setText(d)
             self.lbl_dir.setText(d)
@@ -916,9 +1829,7 @@ class RolodexApp(QMainWindow):
         elif logicalIndex == 1:
             pass
         elif logicalIndex > 1:
-            header_item = self.table.horizontalHeaderItem(logicalIndex)
-            #col_name = header_item.text().replace(" ▼", "")
-            col_name = header_item.text()
+            col_name = self.model.headerData(logicalIndex, Qt.Orientation.Horizontal)
             
             menu = QMenu(self)
             menu.setFont(self.std_font) # Force font
@@ -927,16 +1838,13 @@ class RolodexApp(QMainWindow):
             
             filter_menu = menu.addMenu("Filter")
             
-            values = set()
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, logicalIndex)
-                if item: values.add(item.text())
+            values = self.column_values(col_name)
             
             filter_menu.addAction("Clear Filter", lambda: self.clear_filter(col_name))
             filter_menu.addSeparator()
             
-            sorted_vals = sorted(list(values))
-            current_filters = self.active_filters.get(col_name, [])
+            sorted_vals = sorted(values)
+            current_filters = self.active_filters.get(col_name, set())
             
             all_allowed = col_name not in self.active_filters
             
@@ -956,174 +1864,118 @@ class RolodexApp(QMainWindow):
             menu.exec(QCursor.pos())
 
     def sort_table(self, col_index, order):
-        self.table.sortItems(col_index, order)
+        self.model.sort(col_index, order)
         self.current_sort_col = col_index
         self.current_sort_order = order
+        self.show_sort_indicator()
+
+    def show_sort_indicator(self):
         self.table.horizontalHeader().setSortIndicatorShown(True)
-        self.table.horizontalHeader().setSortIndicator(col_index, order)
+        self.table.horizontalHeader().setSortIndicator(self.current_sort_col, self.current_sort_order)
 
     def toggle_filter(self, col_name, value, checked):
+        # Allowed values are sets, so the per-row test in refresh_table_data is a hash lookup
         if col_name not in self.active_filters:
-            col_idx = -1
-            for i in range(self.table.columnCount()):
-                if self.table.horizontalHeaderItem(i).text() == col_name + " ▼":
-                    col_idx = i
-                    break
-            if col_idx == -1: return
-
-            all_vals = set()
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, col_idx)
-                if item: all_vals.add(item.text())
-            self.active_filters[col_name] = list(all_vals)
+            self.active_filters[col_name] = set(self.column_values(col_name))
         
         if checked:
-            if value not in self.active_filters[col_name]:
-                self.active_filters[col_name].append(value)
+            self.active_filters[col_name].add(value)
         else:
-            if value in self.active_filters[col_name]:
-                self.active_filters[col_name].remove(value)
+            self.active_filters[col_name].discard(value)
         
         self.refresh_table_data()
 
+    def column_values(self, col_name):
+        # Distinct values of a column among the shown rows, reused until the table is next refreshed
+        values = self.filter_values.get(col_name)
+        if values is None:
+            values = self.filter_values[col_name] = {str(c.get(col_name, "")) for c in self.model.contacts}
+        return values
+
     def clear_filter(self, col_name):
         if col_name in self.active_filters:
             del self.active_filters[col_name]
         self.refresh_table_data()
 
     def toggle_select_all(self):
-        if self.table.rowCount() == 0: return
+        if self.model.rowCount() == 0: return
         
-        first_widget = self.table.cellWidget(0, 0)
-        first_chk = first_widget.findChild(QCheckBox)
-        new_state = not first_chk.isChecked()
-        
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, 0)
-            if widget:
-                chk = widget.findChild(QCheckBox)
-                chk.setChecked(new_state)
+        new_state = not self.model.is_checked(0)
+        self.model.set_all_checked(new_state)
 
     # --- TABLE LOGIC ---
     def refresh_table_structure(self):
-        # 1. Image, 2...N: Data
-        #headers = ["✔", "Image"] + [f"{col} ▼" for col in self.config["visible_columns"]]
-        headers = ["✔", "Image"] + self.config["visible_columns"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+        # 0: Select, 1: Image, 2...N: Data
+        self.model.set_columns(self.config["visible_columns"])
         self.table.horizontalHeader().setSortIndicatorShown(False)
         self.current_sort_col = 2 
         self.current_sort_order = Qt.SortOrder.AscendingOrder
 
-        # Force font
-        for i in range(len(headers)):
-            item = self.table.horizontalHeaderItem(i)
-            if item:
-                item.setFont(self.std_font)
-
         self.table.setColumnHidden(1, not self.config["show_images"])
         self.table.setColumnWidth(0, 50)
         self.table.setColumnWidth(1, 150)
         self.refresh_table_data()
 
     def refresh_table(self):
-        if self.table.columnCount() != 2 + len(self.config["visible_columns"]):
-            self.refresh_table_structure()
-        else:
-            self.refresh_table_data()
+        # A refresh can reset the model, re-sort it and resize columns; repaint once at the end
+        with frozen(self.table):
+            if self.model.columnCount() != 2 + len(self.config["visible_columns"]):
+                self.refresh_table_structure()
+            else:
+                self.refresh_table_data()
 
     def refresh_table_data(self):
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
-        self.table.clearContents()
-                
-        query = self.search_bar.text().lower()
+        self.search_timer.stop()    # This refresh already uses the current search text
+        query = self.search_bar.text().casefold()
+        if len(query) < self.config["search_min_length"]: query = ""
+        
+        if query:
+            # A plain substring scan over prebuilt strings; no per-contact lookups on each keystroke.
+            # Text matching a query also matches any part of it, so while the user keeps typing,
+            # only the previous query's matches need checking
+            texts = self.search_texts
+            last = self.search_hits
+            rows = last[1] if last and last[0] in query else range(len(texts))
+            rows = [i for i in rows if query in texts[i]]
+            self.search_hits = (query, rows)
+            candidates = [self.contacts[i] for i in rows]
+        else:
+            candidates = self.contacts
+
+        if not self.active_filters:
+            filtered = list(candidates)     # A copy either way; the model sorts its list in place
+        else:
+            # Narrowest filter first, so most rejected rows fail on the first check
+            filters = sorted(self.active_filters.items(), key=lambda kv: len(kv[1]))
+            filtered = [c for c in candidates if all(c.get(col, "") in allowed for col, allowed in filters)]
         
-        filtered = []
-        for c in self.contacts:
-            if query and query not in "".join([str(v) for v in c.values()]).lower():
-                continue
-            
-            match = True
-            for col, allowed in self.active_filters.items():
-                val = c.get(col, "")
-                if val not in allowed:
-                    match = False
-                    break
-            if match:
-                filtered.append(c)
-        
-        self.table.setRowCount(len(filtered))
-        
-        for row, contact in enumerate(filtered):
-            # 0: Checkbox
-            chk_widget = QWidget()
-            chk_widget.setFont(self.std_font) # Force font
-            chk_layout = QHBoxLayout(chk_widget)
-            chk_layout.setContentsMargins(0,0,0,0)
-            chk_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            chk = QCheckBox()
-            chk.setFont(self.std_font) # Force font
-            chk.setProperty("cid", contact["ID"])
-            chk.stateChanged.connect(self.update_batch_buttons)
-            chk_layout.addWidget(chk)
-            self.table.setCellWidget(row, 0, chk_widget)
-            
-            # 1: Image
-            # IMPROVEMENT 1: Double click image logic passed to label
-            img_label = AspectRatioLabel(double_click_callback=lambda cid=contact["ID"]: self.open_editor_by_id(cid))
-            img_label.setFont(self.std_font) # Force font
-            img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            img_data = contact.get("Image Data", [])
-            if img_data and os.path.exists(img_data[0]["path"]):
-                pix = QPixmap(img_data[0]["path"])
-                if not pix.isNull():
-                    img_label.setPixmap(pix)
-            self.table.setCellWidget(row, 1, img_label)
-            
-            # Data Cols
-            for col_idx, key in enumerate(self.config["visible_columns"]):
-                val = contact.get(key, "")
-                item = QTableWidgetItem(str(val))
-                item.setFont(self.std_font)     # Force font
-                item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-                if key == "E-mail Address" and val:
-                    is_dark = self.config["theme"] == "Dark"
-                    c_scheme = self.config["colors_dark"] if is_dark else self.config["colors_light"]
-                    item.setForeground(QColor(c_scheme["link_color"]))
-                    
-                    #font = item.font()
-                    #font = self.table.font()
-                    font = QFont(self.std_font)
-                    if font.pointSize() <= 0:
-                        font.setPointSize(10)   # Force font size if not already initialized to avoid font size <= 0 warnings
-                    font.setUnderline(True)
-                    item.setFont(font)
-                self.table.setItem(row, 2 + col_idx, item)
-        
-        self.adjust_row_heights()
-        self.update_batch_buttons()
-        #self.table.setSortingEnabled(True)
         if self.current_sort_col > -1:
-            self.sort_table(self.current_sort_col, self.current_sort_order)
-        self.table.blockSignals(False)
+            # Sorted before the model gets it, so the view takes one reset instead of a reset and then a re-sort
+            self.model.sort_rows(filtered, self.current_sort_col, self.current_sort_order)
+        # Filter menus come straight here rather than through refresh_table
+        with frozen(self.table):
+            # The model only hands rows to the view as they are painted; images are decoded by ImageDelegate
+            self.model.set_contacts(filtered)
+            self.filter_values = {}
+            
+            self.adjust_row_heights()
+            #self.table.setSortingEnabled(True)
+            if self.current_sort_col > -1:
+                self.show_sort_indicator()
 
     def on_column_resized(self, logicalIndex, oldSize, newSize):
         if logicalIndex == 1 and self.config["show_images"]:
             self.adjust_row_heights()
 
     def autosize_column(self, col_name):
-        # IMPROVEMENT 3: Use QTableWidget builtin resize to contents, safer than manual calc
+        # IMPROVEMENT 3: Use QTableView builtin resize to contents, safer than manual calc
         if isinstance(col_name, int):
             self.table.resizeColumnToContents(col_name)
             return
 
         # If passed a name (string), find the index
-        for i in range(self.table.columnCount()):
-            header = self.table.horizontalHeaderItem(i)
-            if header and header.text().replace(" ▼", "") == col_name:
-                self.table.resizeColumnToContents(i)
-                break
+        if col_name in self.model.columns:
+            self.table.resizeColumnToContents(2 + self.model.columns.index(col_name))
         
     def adjust_row_heights(self):
         if not self.config["show_images"]:
@@ -1132,30 +1984,21 @@ class RolodexApp(QMainWindow):
             width = self.table.columnWidth(1)
             height = int(width / 1.58)
             if height < 40: height = 40
-            
-        for i in range(self.table.rowCount()):
-            self.table.setRowHeight(i, height)
 
-    def on_item_changed(self, item):
-        pass
+        # Every row shares one height, so set it on the header instead of touching each row
+        self.table.verticalHeader().setDefaultSectionSize(height)
 
     def get_selected_ids(self):
-        ids = []
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, 0)
-            if widget:
-                chk = widget.findChild(QCheckBox)
-                if chk and chk.isChecked():
-                    ids.append(chk.property("cid"))
-        return ids
+        return [c["ID"] for c in self.model.contacts if c["ID"] in self.model.checked]
 
     def update_batch_buttons(self):
-        ids = self.get_selected_ids()
-        if ids:
+        # Runs on every tick, so count the model's set rather than walking the rows. It only ever holds shown IDs
+        n = len(self.model.checked)
+        if n:
             self.btn_del_selected.show()
             self.btn_edit_selected.show()
-            self.btn_del_selected.setText(f"Delete Selected ({len(ids)})")
-            self.btn_edit_selected.setText(f"Edit Selected ({len(ids)})")
+            self.btn_del_selected.setText(f"Delete Selected ({n})")
+            self.btn_edit_selected.setText(f"Edit Selected ({n})")
         else:
             self.btn_del_selected.hide()
             self.btn_edit_selected.hide()
@@ -1176,31 +2019,30 @@ class RolodexApp(QMainWindow):
         editor.show()                       # Open the window
 
     def open_editor_by_id(self, cid):
-        contact = next((c for c in self.contacts if c["ID"] == cid), None)
+        contact = self.contact_by_id(cid)
         if contact:
             self.open_editor_data(contact)
 
-    def on_double_click(self, item):
-        row = item.row()
-        col = item.column()
+    def on_double_click(self, index):
+        row = index.row()
+        col = index.column()
         
-        # Get ID from checkbox widget in col 0
-        widget = self.table.cellWidget(row, 0)
-        # Fix: Widget might be none if clicked while loading
-        if not widget: return
-
-        chk = widget.findChild(QCheckBox)
-        cid = chk.property("cid")
+        # Fix: Index might be stale if clicked while loading
+        if not index.isValid() or row >= self.model.rowCount(): return
+        cid = self.model.contact(row)["ID"]
         
         # 0=Check, 1=Image
+        if col == 0:
+             return
         if col == 1:
              self.open_editor_by_id(cid)
              return
 
         if col >= 2:
-            key = self.config["visible_columns"][col-2]
-            if key == "E-mail Address" and item.text():
-                 QDesktopServices.openUrl(QUrl(f"mailto:{item.text()}"))
+            key = self.model.columns[col-2]
+            text = index.data()
+            if key == "E-mail Address" and text:
+                 QDesktopServices.openUrl(QUrl(f"mailto:{text}"))
                  return
         
         self.open_editor_by_id(cid)
@@ -1210,6 +2052,7 @@ class RolodexApp(QMainWindow):
             try:
                 os.remove(path)
                 print(f"Deleted file: {path}")
+                if os.path.exists(thumbnail_path(path)): os.remove(thumbnail_path(path))
             except Exception as e:
                 print(f"Could not delete file {path}: {e}")
 
@@ -1218,133 +2061,48 @@ class RolodexApp(QMainWindow):
         if not files: return
 
         # 1. Dependency Check
+        load_ocr_libraries()
         if is_pdf and convert_from_path is None:
             QMessageBox.critical(self, "Missing Library", "The 'pdf2image' library is not installed.\nRun: pip install pdf2image")
             return
 
-        for f in files: # Go thru each file the user selected
-            # Initialize blank data
-            new_data = {k: "" for k in CSV_HEADERS}
-            new_data["ID"] = str(uuid.uuid4())
-            new_data["Image Data"] = []
-            new_data["Notes Data"] = []
-            first_note_text = "Card Text"
-            base_name = "Img"
-            base_name_0 = "Card"
-            base_name_1 = "Back"
-            imgs = []
-
-            file_base_name = os.path.basename(f)
-            file_name, file_extension = os.path.splitext(file_base_name)
-
-            if is_pdf:
-                try:
-                    # POPPLER CHECK: convert_from_path requires Poppler
-                    # You might need to set poppler_path=r'C:\path\to\poppler\bin' if on Windows and not in PATH
-                    poppler_path = self.config["poppler_bin"]
-                    # Debug print to console
-                    #print(f"Attempting to convert: {f}")
-                    #print(f"Using Poppler Path: {poppler_path}")
-                    
-                    # Attempt Conversion
-                    #try:
-                    #    imgs = convert_from_path(f, poppler_path=poppler_path)
-                    #except:
-                    #    print("Can't convert poppler path to path")                    
-                    imgs = convert_from_path(f, poppler_path=poppler_path)
-                    
-                    if not imgs:
-                        print("PDF converted but returned 0 images.")
-                        
-                    for i, img in enumerate(imgs):
-                        fname = f"{file_name}__{i}.jpg"
-                        path = os.path.join(self.config["working_directory"], IMG_FOLDER_NAME, fname)
-                        img.save(path, "JPEG")
-
-                        if i == 0:      # First card / image. Should be front typically
-                            new_data["Image Data"].append({"name": f"{base_name_0}", "path": path})
-                        elif i == 1:    # Second card / image. Should be back typically
-                            new_data["Image Data"].append({"name": f"{base_name_1}", "path": path})
-                        else:           # Additional images. No expectation so list as generic import
-                            new_data["Image Data"].append({"name": f"{base_name} {i+1}", "path": path})
-
-                        # OCR Logic (Requires Tesseract)
-                        if i == 0:
-                            if pytesseract:
-                                try:
-                                    pytesseract.pytesseract.tesseract_cmd = self.config["tesseract_path"]
-                                    text = pytesseract.image_to_string(img)
-                                    filtered_text = self.gibberish_filter(text)
-                                    new_data = self.heuristic_parse(filtered_text, new_data, self.contacts)
-                                    #new_data = self.heuristic_parse(text, new_data, self.contacts)
-                                    new_data["Notes Data"].append({"name": first_note_text, "content": text})
-                                except Exception as ocr_e:
-                                    print(f"OCR Failed (Tesseract might be missing): {ocr_e}")
-                                    QMessageBox.warning(self, "OCR Error", f"Failed to parse PDF text:\n{error_msg}")
-                            else:
-                                print("Skipping OCR: Pytesseract library not found.")
-                                QMessageBox.critical(self, "OCR Error", 
-                                f"Could not find Python Tesseract library.\n\n"
-                                f"Current Configured Path: {self.config["tesseract_path"]}\n\n"
-                                "Please update the \"tesseract_path\" variable in the \'config.txt\" file.")
-
-                except Exception as e:
-                    # CRITICAL: Catch the specific error and show it to the user
-                    error_msg = str(e)
-                    print(f"PDF Conversion Error: {error_msg}")
-                    
-                    if "poppler" in error_msg.lower() or "not in path" in error_msg.lower():
-                        QMessageBox.critical(self, "Poppler Error", 
-                            f"Could not find Poppler tools.\n\n"
-                            f"Current Configured Path: {self.config["poppler_bin"]}\n\n"
-                            f"System Error: {error_msg}\n\n"
-                            "Please update the \"poppler_bin\" variable in the \'config.txt\" file.")
-                    else:
-                        QMessageBox.warning(self, "PDF Error", f"Failed to convert PDF:\n{error_msg}")
-                    return # Stop processing to avoid opening empty window
-            else:
-                # Standard Image Handling
-                fname = f"{file_name}{file_extension}"
-                path = os.path.join(self.config["working_directory"], IMG_FOLDER_NAME, fname)
-                try:
-                    shutil.copy2(f, path)
-                    new_data["Image Data"].append({"name": base_name_0, "path": path})
-                    
-                    if pytesseract:
-                        try:
-                            pytesseract.pytesseract.tesseract_cmd = self.config["tesseract_path"]
-                            img = Image.open(path)
-                            text = pytesseract.image_to_string(img)
-                            filtered_text = self.gibberish_filter(text)
-                            new_data = self.heuristic_parse(filtered_text, new_data, self.contacts)
-                            new_data["Notes Data"].append({"name": first_note_text, "content": text})
-                        except Exception as ocr_e:
-                            print(f"OCR Failed (Tesseract might be missing): {ocr_e}")
-                    else:
-                        print("Skipping OCR: Pytesseract library not found.")
-                        QMessageBox.critical(self, "OCR Error", 
-                        f"Could not find Python Tesseract library.\n\n"
-                        f"Current Configured Path: {self.config["tesseract_path"]}\n\n"
-                        "Please update the \"tesseract_path\" variable in the \'config.txt\" file.")
-                except Exception as e:
-                    QMessageBox.warning(self, "Image Error", f"Failed to process Image:\n{e}")
-
-            # Only open editor if we actually got data/images
-            if new_data["Image Data"]:
-                self.open_editor_data(new_data)
-            else:
-                print("No data found to populate editor.")
+        if not (pytesseract or tesserocr):
+            print("Skipping OCR: Pytesseract library not found.")
+            QMessageBox.critical(self, "OCR Error", 
+            f"Could not find Python Tesseract library.\n\n"
+            f"Current Configured Path: {self.config["tesseract_path"]}\n\n"
+            "Please update the \"tesseract_path\" variable in the \'config.txt\" file.")
+
+        # Rendering and OCR run in the background; each card opens in an editor as soon as it is parsed
+        worker = OcrWorker(self, files, is_pdf)
+        worker.resultReady.connect(self.open_editor_data)
+        worker.failed.connect(self.show_import_error)
+        worker.progress.connect(self.show_import_progress)
+        self.ocr_workers.append(worker)
+        worker.finished.connect(lambda: self.ocr_workers.remove(worker) if worker in self.ocr_workers else None)
+        worker.finished.connect(lambda: self.statusBar().showMessage("Import finished", 3000))
+        self.statusBar().showMessage(f"Importing {len(files)} file(s)...")
+        worker.start()
+
+    def show_import_progress(self, done, total):
+        self.statusBar().showMessage(f"Importing cards: {done} of {total}")
+
+    def show_import_error(self, title, message, is_critical):
+        if is_critical:
+            QMessageBox.critical(self, title, message)
+        else:
+            QMessageBox.warning(self, title, message)
 
     def gibberish_filter(self, text):
         """ 
         Attempts to remove gibberish lines from text that were falsely recognized text from graphics
         """ 
         # PRE-PROCESSING & GIBBERISH FILTERING
-        raw_lines = text.split('\n')
+        raw_lines = text.translate(OCR_CLEAN_TABLE).split('\n')
         clean_lines = []
         
         for line in raw_lines:
-            line = line.strip()
+            line = SPACE_RUN_RE.sub(' ', line).strip()
             if not line: continue
             
             # Filter: Line is too short or mostly symbols
@@ -1368,13 +2126,7 @@ class RolodexApp(QMainWindow):
         """ 
         lines = text 
         used_indices = set()
-        
-        # --- PATTERNS ---
-        email_re = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
-        phone_re = re.compile(r'(?:(?:\+?1\s*(?:[.-]\s*)?)?(?:\(\s*([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9])\s*\)|([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9]))\s*(?:[.-]\s*)?)?([2-9]1[02-9]|[2-9][02-9]1|[2-9][02-9]{2})\s*(?:[.-]\s*)?([0-9]{4})(?:\s*(?:#|x\.?|ext\.?|extension)\s*(\d+))?')
-        url_re = re.compile(r'(https?://)?(www\.)?([a-zA-Z0-9-]+)(\.[a-zA-Z]{2,})+')
-        zip_re = re.compile(r'\b\d{5}(?:-\d{4})?\b')
-        
+
         titles = ["manager", "director", "president", "vp", "ceo", "cfo", "cto", "chief", 
                   "engineer", "developer", "consultant", "specialist", "coordinator", 
                   "administrator", "assistant", "associate", "founder", "owner", "partner", "lead", "head", "rep"]
@@ -1387,7 +2139,7 @@ class RolodexApp(QMainWindow):
                          "dr", "drive", "lane", "suite", "floor", "box", "po box", "plaza", "circle", "ste", "bldg"]
 
         def format_phone(raw_num):
-            digits = re.sub(r'\D', '', raw_num)
+            digits = NON_DIGIT_RE.sub('', raw_num)
             if len(digits) == 11 and digits.startswith('1'): digits = digits[1:]
             if len(digits) == 10: return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
             return raw_num if len(digits) < 10 else f"+{digits}" if not digits.startswith('1') else digits
@@ -1397,7 +2149,7 @@ class RolodexApp(QMainWindow):
         # 1. EMAILS (High Confidence)
         for i, line in enumerate(lines):
             if i in used_indices: continue
-            emails = email_re.findall(line)
+            emails = EMAIL_RE.findall(line)
             if emails:
                 data["E-mail Address"] = emails[0]
                 used_indices.add(i)
@@ -1405,8 +2157,10 @@ class RolodexApp(QMainWindow):
         # 2. PHONES (Aggressive Filling)
         found_phones = []
         for i, line in enumerate(lines):
-            # Scan line for numbers
-            matches = list(phone_re.finditer(line))
+            # Scan line for numbers, reading O/l/I misreads inside numeric words as the digits they replaced.
+            # The fix-up maps one character to one, so match positions still line up with the original line
+            digit_line = DIGIT_WORD_RE.sub(lambda m: m.group(0).translate(OCR_DIGIT_FIXES), line)
+            matches = list(PHONE_RE.finditer(digit_line))
             for match in matches:
                 formatted = format_phone(match.group(0))
                 
@@ -1445,7 +2199,7 @@ class RolodexApp(QMainWindow):
         website_domain = ""
         for i, line in enumerate(lines):
             if i in used_indices: continue
-            match = url_re.search(line)
+            match = URL_RE.search(line)
             if match:
                 website_domain = match.group(3).capitalize()
                 used_indices.add(i)
@@ -1455,7 +2209,7 @@ class RolodexApp(QMainWindow):
         for i, line in enumerate(lines):
             if i in used_indices: continue
             # Anchor on Zip Code or State-like patterns
-            if zip_re.search(line):
+            if ZIP_RE.search(line):
                 addr_lines.insert(0, line)
                 used_indices.add(i)
                 # Check line above